@@ -20,102 +20,57 @@ For loading previously serialized evidence from JSON:
     from src import load_evidence_from_json
     evidence = load_evidence_from_json(json_data)
 
+    # Whole files or JSON Lines are parsed and validated by pydantic-core directly
+    from src import load_evidence_from_bytes, load_evidence_stream
+    evidence_list = load_evidence_from_bytes(Path("evidence.json").read_bytes())
+    evidence_iter = load_evidence_stream(open("evidence.jsonl", "rb"))
+
 For schema types (type hints, manual construction):
 
     from src.schema import CommitObservation, IOC, EvidenceSource
 """
 
-from typing import Annotated, Union
-
-from pydantic import Field, TypeAdapter
+import importlib
+from typing import TYPE_CHECKING
 
 from .store import EvidenceStore
 
-# Import all types needed for discriminated union deserialization
-from .schema.events import (
-    PushEvent,
-    PullRequestEvent,
-    IssueEvent,
-    IssueCommentEvent,
-    CreateEvent,
-    DeleteEvent,
-    ForkEvent,
-    WorkflowRunEvent,
-    ReleaseEvent,
-    WatchEvent,
-    MemberEvent,
-    PublicEvent,
-    AnyEvent,
-)
-from .schema.observations import (
-    CommitObservation,
-    IssueObservation,
-    FileObservation,
-    ForkObservation,
-    BranchObservation,
-    TagObservation,
-    ReleaseObservation,
-    SnapshotObservation,
-    IOC,
-    ArticleObservation,
-    AnyObservation,
-)
-
 # Re-export commonly used enums for convenience
 from .schema.common import EvidenceSource, IOCType
 
-# Combined type alias
-AnyEvidence = AnyEvent | AnyObservation
-
-# Pydantic discriminated unions for efficient JSON deserialization
-_EventUnion = Annotated[
-    Union[
-        PushEvent, PullRequestEvent, IssueEvent, IssueCommentEvent,
-        CreateEvent, DeleteEvent, ForkEvent, WorkflowRunEvent,
-        ReleaseEvent, WatchEvent, MemberEvent, PublicEvent,
-    ],
-    Field(discriminator="event_type"),
-]
-
-_ObservationUnion = Annotated[
-    Union[
-        CommitObservation, IssueObservation, FileObservation, ForkObservation,
-        BranchObservation, TagObservation, ReleaseObservation, SnapshotObservation,
-        IOC, ArticleObservation,
-    ],
-    Field(discriminator="observation_type"),
-]
-
-_event_adapter = TypeAdapter(_EventUnion)
-_observation_adapter = TypeAdapter(_ObservationUnion)
-
-
-def load_evidence_from_json(data: dict) -> AnyEvidence:
-    """
-    Load a previously serialized evidence object from JSON.
-
-    Args:
-        data: Dictionary from JSON deserialization (e.g., json.load())
-
-    Returns:
-        The appropriate Event or Observation instance
-
-    Raises:
-        ValueError: If the data cannot be parsed into a known evidence type
-    """
-    if "event_type" in data:
-        try:
-            return _event_adapter.validate_python(data)
-        except Exception as e:
-            raise ValueError(f"Unknown event_type: {data.get('event_type')}") from e
-
-    if "observation_type" in data:
-        try:
-            return _observation_adapter.validate_python(data)
-        except Exception as e:
-            raise ValueError(f"Unknown observation_type: {data.get('observation_type')}") from e
-
-    raise ValueError("Data must contain 'event_type' or 'observation_type' field")
+if TYPE_CHECKING:
+    from .loading import (
+        build_validators,
+        load_evidence_from_bytes,
+        load_evidence_from_json,
+        load_evidence_stream,
+    )
+    from .schema import AnyEvent, AnyEvidence, AnyObservation
+
+# Resolved on first access (PEP 562): loading builds on every event/observation
+# model, which importers that only want the store or enums never pay for.
+_LAZY_ATTRS = {
+    "load_evidence_from_json": ".loading",
+    "load_evidence_from_bytes": ".loading",
+    "load_evidence_stream": ".loading",
+    "build_validators": ".loading",
+    "AnyEvidence": ".schema",
+    "AnyEvent": ".schema",
+    "AnyObservation": ".schema",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 # Public API - minimal surface area
@@ -123,6 +78,9 @@ __all__ = [
     # Main entry points
     "EvidenceStore",
     "load_evidence_from_json",
+    "load_evidence_from_bytes",
+    "load_evidence_stream",
+    "build_validators",
     # Type aliases (for type hints)
     "AnyEvidence",
     "AnyEvent",
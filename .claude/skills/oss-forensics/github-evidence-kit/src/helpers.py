@@ -4,59 +4,121 @@ Shared helper functions for evidence creation and parsing.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Iterable, Sequence
 
 from .schema.common import GitHubActor, GitHubRepository
 
+# Optional C ISO-8601 parser; the stdlib fallback below handles everything it does
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None  # type: ignore[assignment]
+
 
 def generate_evidence_id(prefix: str, *parts: str) -> str:
     """Generate a deterministic evidence ID.
 
     Creates a unique ID by hashing the parts and prefixing with the type.
-    Same inputs always produce the same ID (idempotent).
+    Same inputs always produce the same ID (idempotent). IDs are persisted and
+    cross-referenced (e.g. IOC.extracted_from), so the hash must stay SHA-256.
 
     Returns:
         ID in format: "{prefix}-{12-char-hash}"
     """
-    content = ":".join(parts)
-    hash_val = hashlib.sha256(content.encode()).hexdigest()[:12]
+    # Hex-encode only the 6 digest bytes we keep (12 hex chars)
+    hash_val = hashlib.sha256(":".join(parts).encode()).digest()[:6].hex()
     return f"{prefix}-{hash_val}"
 
 
-# Common datetime formats to try
-_DATETIME_FORMATS = [
-    "%Y-%m-%dT%H:%M:%SZ",
-    "%Y-%m-%dT%H:%M:%S%z",
-    "%Y-%m-%d %H:%M:%S %Z",
-    "%Y-%m-%d %H:%M:%S",
-]
+def generate_evidence_ids(prefix: str, rows: Iterable[Sequence[str]]) -> list[str]:
+    """Generate evidence IDs for many rows sharing a prefix.
+
+    Batch form of generate_evidence_id for bulk ingestion; each ID is identical
+    to ``generate_evidence_id(prefix, *parts)`` for the same row.
+    """
+    sha256 = hashlib.sha256
+    return [f"{prefix}-{sha256(':'.join(parts).encode()).digest()[:6].hex()}" for parts in rows]
+
+
+_UTC = timezone.utc
+
+# strptime fallbacks for strings fromisoformat rejects (unpadded fields, zone names),
+# as (format, needs_utc). Only %z yields an aware datetime; the rest parse naive
+# and are taken as UTC.
+_FORMAT_ZULU = ("%Y-%m-%dT%H:%M:%SZ", True)
+_FORMAT_OFFSET = ("%Y-%m-%dT%H:%M:%S%z", False)
+_FORMAT_ZONE_NAME = ("%Y-%m-%d %H:%M:%S %Z", True)
+_FORMAT_NAIVE = ("%Y-%m-%d %H:%M:%S", True)
+
+
+def _strptime_format(dt_str: str) -> tuple[str, bool]:
+    """Pick the one fallback format matching the string's shape.
+
+    Avoids trying each format in turn and paying for a raised ValueError per miss.
+    """
+    if dt_str[-1:] in ("Z", "z"):
+        return _FORMAT_ZULU
+    if dt_str[-1:].isalpha():
+        return _FORMAT_ZONE_NAME
+    if "T" in dt_str:
+        return _FORMAT_OFFSET
+    return _FORMAT_NAIVE
 
 
 def _try_parse_datetime(dt_str: str) -> datetime | None:
-    """Attempt to parse datetime string. Returns None if all formats fail."""
-    # Handle Z suffix for ISO format
-    if dt_str.endswith("Z"):
+    """Attempt to parse datetime string. Returns None if all parsers fail."""
+    # Fast path: ciso8601 handles ISO 8601 / RFC 3339, including the Z suffix
+    if ciso8601 is not None:
         try:
-            return datetime.fromisoformat(dt_str[:-1] + "+00:00")
+            return ciso8601.parse_datetime(dt_str)
         except ValueError:
             pass
 
-    # Try fromisoformat first (handles most ISO formats)
+    # Try fromisoformat first (handles most ISO formats, including the Z suffix)
     try:
         return datetime.fromisoformat(dt_str)
     except ValueError:
         pass
 
     # Fall back to strptime for edge cases
-    for fmt in _DATETIME_FORMATS:
-        try:
-            return datetime.strptime(dt_str, fmt).replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
+    fmt, needs_utc = _strptime_format(dt_str)
+    try:
+        dt = datetime.strptime(dt_str, fmt)
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=_UTC) if needs_utc else dt
+
+
+def _lenient_now(_: Any) -> datetime:
+    return datetime.now(_UTC)
+
+
+def _lenient_passthrough(dt: datetime) -> datetime:
+    return dt
 
-    return None
+
+def _lenient_from_str(dt_str: str) -> datetime:
+    return _try_parse_datetime(dt_str) or datetime.now(_UTC)
+
+
+def _lenient_fallback(value: Any) -> datetime:
+    """Slow path for subclasses (e.g. pandas Timestamp) and unsupported types."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _lenient_from_str(value)
+    return datetime.now(_UTC)
+
+
+# Exact-type dispatch: one dict lookup instead of a chain of isinstance checks
+_LENIENT_PARSERS: dict[type, Callable[[Any], datetime]] = {
+    type(None): _lenient_now,
+    datetime: _lenient_passthrough,
+    str: _lenient_from_str,
+}
 
 
 def parse_datetime_lenient(dt_str: Any) -> datetime:
@@ -65,21 +127,31 @@ def parse_datetime_lenient(dt_str: Any) -> datetime:
     Lenient parsing for GH Archive data where dates might be malformed.
     Returns current UTC time if parsing fails.
     """
-    if dt_str is None:
-        return datetime.now(timezone.utc)
-    if isinstance(dt_str, datetime):
-        return dt_str
-    if isinstance(dt_str, str):
-        result = _try_parse_datetime(dt_str)
-        if result:
-            return result
-    return datetime.now(timezone.utc)
+    return _LENIENT_PARSERS.get(type(dt_str), _lenient_fallback)(dt_str)
+
+
+def parse_datetime_lenient_batch(values: list[Any], default: datetime) -> list[datetime]:
+    """Parse many datetimes leniently, sharing one fallback.
+
+    Batch variant of parse_datetime_lenient for bulk GH Archive ingestion:
+    unparseable values get ``default`` (typically one ``datetime.now(timezone.utc)``
+    taken per batch) instead of a fresh timestamp per row.
+    """
+    results = []
+    for value in values:
+        if isinstance(value, datetime):
+            results.append(value)
+        elif isinstance(value, str):
+            results.append(_try_parse_datetime(value) or default)
+        else:
+            results.append(default)
+    return results
 
 
 def parse_datetime_strict(dt_str: str | datetime | None) -> datetime | None:
     """Parse datetime, strict mode.
 
-    For verified data sources where dates should be valid.
+    For verified data sources (GitHub API, git) that always emit ISO 8601.
     Returns None for None input, raises ValueError on invalid format.
     """
     if dt_str is None:
@@ -87,10 +159,10 @@ def parse_datetime_strict(dt_str: str | datetime | None) -> datetime | None:
     if isinstance(dt_str, datetime):
         return dt_str
 
-    result = _try_parse_datetime(dt_str)
-    if result:
-        return result
-    raise ValueError(f"Unable to parse datetime: {dt_str}")
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError as e:
+        raise ValueError(f"Unable to parse datetime: {dt_str}") from e
 
 
 def make_actor(login: str, actor_id: int | None = None) -> GitHubActor:
@@ -98,9 +170,15 @@ def make_actor(login: str, actor_id: int | None = None) -> GitHubActor:
     return GitHubActor(login=login, id=actor_id)
 
 
+@functools.lru_cache(maxsize=100_000)
+def _cached_repo(owner: str, name: str, full_name: str) -> GitHubRepository:
+    """Shared GitHubRepository per repo; bulk loads see the same few repos repeatedly."""
+    return GitHubRepository(owner=owner, name=name, full_name=full_name)
+
+
 def make_repo(owner: str, name: str) -> GitHubRepository:
     """Create GitHubRepository from owner and name."""
-    return GitHubRepository(owner=owner, name=name, full_name=f"{owner}/{name}")
+    return _cached_repo(owner, name, f"{owner}/{name}")
 
 
 def make_repo_from_full_name(full_name: str) -> GitHubRepository:
@@ -120,4 +198,4 @@ def make_repo_from_full_name(full_name: str) -> GitHubRepository:
     if not owner or not name or owner == "unknown" or name == "unknown":
         raise ValueError(f"Invalid repository full_name: '{full_name}' - owner and name must be valid")
 
-    return GitHubRepository(owner=owner, name=name, full_name=full_name)
+    return _cached_repo(owner, name, full_name)
@@ -0,0 +1,252 @@
+"""
+Loading of serialized evidence (JSON dicts, raw JSON, JSON Lines) into models.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Union,
+)
+
+from pydantic import BaseModel, Discriminator, Field, Tag
+from pydantic import TypeAdapter as _TypeAdapter
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from .schema import AnyEvidence
+else:
+    # Memoized so adapters are built on first use (the core-schema build is the
+    # expensive part) and every later request for the same annotation reuses
+    # the compiled validator.
+    TypeAdapter = functools.lru_cache(maxsize=None)(_TypeAdapter)
+
+# Import all types needed for discriminated union deserialization
+from .schema.events import (
+    PushEvent,
+    PullRequestEvent,
+    IssueEvent,
+    IssueCommentEvent,
+    CreateEvent,
+    DeleteEvent,
+    ForkEvent,
+    WorkflowRunEvent,
+    ReleaseEvent,
+    WatchEvent,
+    MemberEvent,
+    PublicEvent,
+)
+from .schema.observations import (
+    CommitObservation,
+    IssueObservation,
+    FileObservation,
+    ForkObservation,
+    BranchObservation,
+    TagObservation,
+    ReleaseObservation,
+    SnapshotObservation,
+    IOC,
+    ArticleObservation,
+)
+
+# Pydantic discriminated unions for efficient JSON deserialization
+_EventUnion = Annotated[
+    Union[
+        PushEvent, PullRequestEvent, IssueEvent, IssueCommentEvent,
+        CreateEvent, DeleteEvent, ForkEvent, WorkflowRunEvent,
+        ReleaseEvent, WatchEvent, MemberEvent, PublicEvent,
+    ],
+    Field(discriminator="event_type"),
+]
+
+_ObservationUnion = Annotated[
+    Union[
+        CommitObservation, IssueObservation, FileObservation, ForkObservation,
+        BranchObservation, TagObservation, ReleaseObservation, SnapshotObservation,
+        IOC, ArticleObservation,
+    ],
+    Field(discriminator="observation_type"),
+]
+
+
+def _evidence_kind(value: Any) -> str | None:
+    """Route raw JSON objects to the event or observation union."""
+    if isinstance(value, dict):
+        if "event_type" in value:
+            return "event"
+        if "observation_type" in value:
+            return "observation"
+    return None
+
+
+# Any evidence, for validating raw JSON in a single pydantic-core pass
+_EvidenceUnion = Annotated[
+    Union[
+        Annotated[_EventUnion, Tag("event")],
+        Annotated[_ObservationUnion, Tag("observation")],
+    ],
+    Discriminator(_evidence_kind),
+]
+
+
+# Direct discriminator -> model lookup, so loading skips the tagged-union layer
+_EVENT_TYPE_MAP: dict[str, type[BaseModel]] = {
+    "push": PushEvent,
+    "pull_request": PullRequestEvent,
+    "issue": IssueEvent,
+    "issue_comment": IssueCommentEvent,
+    "create": CreateEvent,
+    "delete": DeleteEvent,
+    "fork": ForkEvent,
+    "workflow_run": WorkflowRunEvent,
+    "release": ReleaseEvent,
+    "watch": WatchEvent,
+    "member": MemberEvent,
+    "public": PublicEvent,
+}
+
+_OBSERVATION_TYPE_MAP: dict[str, type[BaseModel]] = {
+    "commit": CommitObservation,
+    "issue": IssueObservation,
+    "file": FileObservation,
+    "fork": ForkObservation,
+    "branch": BranchObservation,
+    "tag": TagObservation,
+    "release": ReleaseObservation,
+    "snapshot": SnapshotObservation,
+    "ioc": IOC,
+    "article": ArticleObservation,
+}
+
+
+# Compiled validate_python per tag, filled as each model is first loaded. Calling
+# the pydantic-core validator directly skips the model_validate wrapper; filling
+# lazily keeps the models' defer_build (no validator is built at import).
+_EVENT_VALIDATORS: dict[str, Callable[[Any], AnyEvidence]] = {}
+_OBSERVATION_VALIDATORS: dict[str, Callable[[Any], AnyEvidence]] = {}
+
+
+def _resolve_validator(
+    tag: Any,
+    type_map: dict[str, type[BaseModel]],
+    validators: dict[str, Callable[[Any], AnyEvidence]],
+) -> Callable[[Any], AnyEvidence] | None:
+    """Build and cache the validator for ``tag``. Returns None for unknown tags."""
+    cls = type_map.get(tag) if isinstance(tag, str) else None
+    if cls is None:
+        return None
+    cls.model_rebuild()
+    validate = validators[tag] = cls.__pydantic_validator__.validate_python
+    return validate
+
+
+def build_validators() -> None:
+    """
+    Build the validators of every event and observation model.
+
+    Models are declared with ``defer_build``, so each validator is otherwise built
+    the first time that model validates data. Long-running services can call this
+    once at startup to pay the cost up front; short scripts that never validate
+    skip it entirely.
+    """
+    for tag in _EVENT_TYPE_MAP:
+        _resolve_validator(tag, _EVENT_TYPE_MAP, _EVENT_VALIDATORS)
+    for tag in _OBSERVATION_TYPE_MAP:
+        _resolve_validator(tag, _OBSERVATION_TYPE_MAP, _OBSERVATION_VALIDATORS)
+
+
+# Single C-level lookup of the discriminator (KeyError when absent)
+_get_event_type = operator.itemgetter("event_type")
+_get_observation_type = operator.itemgetter("observation_type")
+
+
+def load_evidence_from_json(data: dict | str | bytes) -> AnyEvidence:
+    """
+    Load a previously serialized evidence object from JSON.
+
+    Args:
+        data: Dictionary from JSON deserialization (e.g., json.load()), or the raw
+            JSON text of one object, which pydantic-core parses and validates
+            without building an intermediate dict
+
+    Returns:
+        The appropriate Event or Observation instance
+
+    Raises:
+        ValueError: If the data cannot be parsed into a known evidence type
+    """
+    if isinstance(data, (str, bytes)):
+        # Raw JSON is always validated: parsing it is most of the work anyway
+        return TypeAdapter(_EvidenceUnion).validate_json(data)
+
+    union: Any  # Annotated union alias, passed to TypeAdapter on the slow path
+    try:
+        tag = _get_event_type(data)
+        tag_field, validators, type_map, union = (
+            "event_type", _EVENT_VALIDATORS, _EVENT_TYPE_MAP, _EventUnion
+        )
+    except (KeyError, TypeError):
+        try:
+            tag = _get_observation_type(data)
+            tag_field, validators, type_map, union = (
+                "observation_type", _OBSERVATION_VALIDATORS, _OBSERVATION_TYPE_MAP, _ObservationUnion
+            )
+        except (KeyError, TypeError):
+            raise ValueError("Data must contain 'event_type' or 'observation_type' field") from None
+
+    try:
+        validate = validators[tag]
+    except (KeyError, TypeError):
+        resolved = _resolve_validator(tag, type_map, validators)
+        if resolved is not None:
+            return resolved(data)
+    else:
+        return validate(data)
+
+    # Slow path: unknown tag, let the tagged union report what it expected
+    try:
+        return TypeAdapter(union).validate_python(data)
+    except Exception as e:
+        raise ValueError(f"Unknown {tag_field}: {tag}") from e
+
+
+def load_evidence_from_bytes(raw: bytes | str) -> list[AnyEvidence]:
+    """
+    Load a serialized evidence list (e.g., an EvidenceStore JSON file) in one pass.
+
+    JSON parsing and validation of every item happen inside pydantic-core, without
+    building intermediate Python dicts or dispatching per item in Python.
+
+    Args:
+        raw: JSON array of serialized evidence objects
+
+    Returns:
+        Event and Observation instances, in input order
+
+    Raises:
+        ValueError: If the JSON is malformed or any item is not valid evidence
+    """
+    return TypeAdapter(list[_EvidenceUnion]).validate_json(raw)
+
+
+def load_evidence_stream(lines: Iterable[bytes | str]) -> Iterator[AnyEvidence]:
+    """
+    Lazily load evidence from JSON Lines (one serialized object per line).
+
+    Blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is malformed or not valid evidence
+    """
+    adapter = TypeAdapter(_EvidenceUnion)
+    for line in lines:
+        if line.strip():
+            yield adapter.validate_json(line)
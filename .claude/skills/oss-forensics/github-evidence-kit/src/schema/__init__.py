@@ -1,56 +1,132 @@
 """
 Schema definitions for evidence types.
+
+Names are resolved on first access (PEP 562), so importing one submodule (e.g.
+``schema.common`` for the enums) doesn't build every event and observation model.
 """
-from .common import (
-    EvidenceSource,
-    EventType,
-    RefType,
-    PRAction,
-    IssueAction,
-    WorkflowConclusion,
-    IOCType,
-    GitHubActor,
-    GitHubRepository,
-    VerificationInfo,
-    VerificationResult,
-)
-from .events import (
-    Event,
-    CommitInPush,
-    PushEvent,
-    PullRequestEvent,
-    IssueEvent,
-    IssueCommentEvent,
-    CreateEvent,
-    DeleteEvent,
-    ForkEvent,
-    WorkflowRunEvent,
-    ReleaseEvent,
-    WatchEvent,
-    MemberEvent,
-    PublicEvent,
-    AnyEvent,
-)
-from .observations import (
-    Observation,
-    CommitAuthor,
-    FileChange,
-    CommitObservation,
-    IssueObservation,
-    FileObservation,
-    ForkObservation,
-    BranchObservation,
-    TagObservation,
-    ReleaseObservation,
-    WaybackSnapshot,
-    SnapshotObservation,
-    IOC,
-    ArticleObservation,
-    AnyObservation,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .common import (
+        EvidenceSource,
+        EventType,
+        RefType,
+        PRAction,
+        IssueAction,
+        WorkflowConclusion,
+        IOCType,
+        GitHubActor,
+        GitHubRepository,
+        VerificationInfo,
+        VerificationResult,
+    )
+    from .events import (
+        Event,
+        CommitInPush,
+        PushEvent,
+        PullRequestEvent,
+        IssueEvent,
+        IssueCommentEvent,
+        CreateEvent,
+        DeleteEvent,
+        ForkEvent,
+        WorkflowRunEvent,
+        ReleaseEvent,
+        WatchEvent,
+        MemberEvent,
+        PublicEvent,
+        AnyEvent,
+    )
+    from .observations import (
+        Observation,
+        CommitAuthor,
+        FileChange,
+        CommitObservation,
+        IssueObservation,
+        FileObservation,
+        ForkObservation,
+        BranchObservation,
+        TagObservation,
+        ReleaseObservation,
+        WaybackSnapshot,
+        SnapshotObservation,
+        IOC,
+        ArticleObservation,
+        AnyObservation,
+    )
+
+    # Combined type alias for any evidence type
+    AnyEvidence = AnyEvent | AnyObservation
+
+_SUBMODULES = {
+    ".common": (
+        "EvidenceSource",
+        "EventType",
+        "RefType",
+        "PRAction",
+        "IssueAction",
+        "WorkflowConclusion",
+        "IOCType",
+        "GitHubActor",
+        "GitHubRepository",
+        "VerificationInfo",
+        "VerificationResult",
+    ),
+    ".events": (
+        "Event",
+        "CommitInPush",
+        "PushEvent",
+        "PullRequestEvent",
+        "IssueEvent",
+        "IssueCommentEvent",
+        "CreateEvent",
+        "DeleteEvent",
+        "ForkEvent",
+        "WorkflowRunEvent",
+        "ReleaseEvent",
+        "WatchEvent",
+        "MemberEvent",
+        "PublicEvent",
+        "AnyEvent",
+    ),
+    ".observations": (
+        "Observation",
+        "CommitAuthor",
+        "FileChange",
+        "CommitObservation",
+        "IssueObservation",
+        "FileObservation",
+        "ForkObservation",
+        "BranchObservation",
+        "TagObservation",
+        "ReleaseObservation",
+        "WaybackSnapshot",
+        "SnapshotObservation",
+        "IOC",
+        "ArticleObservation",
+        "AnyObservation",
+    ),
+}
+_LAZY_ATTRS = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    if name == "AnyEvidence":
+        value = __getattr__("AnyEvent") | __getattr__("AnyObservation")
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Combined type alias for any evidence type
-AnyEvidence = AnyEvent | AnyObservation
 
 __all__ = [
     # Enums
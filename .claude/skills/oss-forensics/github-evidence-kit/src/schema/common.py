@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, HttpUrl, model_validator
+from pydantic import BaseModel, ConfigDict, HttpUrl, model_validator
 
 
 # =============================================================================
@@ -101,7 +101,9 @@ class GitHubActor(BaseModel):
 
 
 class GitHubRepository(BaseModel):
-    """GitHub repository."""
+    """GitHub repository. Immutable so instances can be shared between evidence."""
+
+    model_config = ConfigDict(frozen=True)
 
     owner: str
     name: str
@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import (
     EvidenceSource,
@@ -31,6 +31,9 @@ from .common import (
 class Event(BaseModel):
     """Something that happened."""
 
+    # Validators are built on first use (or by build_validators()), not at import
+    model_config = ConfigDict(defer_build=True)
+
     evidence_id: str
     when: datetime
     who: GitHubActor
@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from .common import (
     EvidenceSource,
@@ -31,6 +31,9 @@ from .common import (
 class Observation(BaseModel):
     """Something we observed."""
 
+    # Validators are built on first use (or by build_validators()), not at import
+    model_config = ConfigDict(defer_build=True)
+
     evidence_id: str
 
     # Original event (if known)
@@ -9,11 +9,13 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence
 
-from .schema import AnyEvidence, AnyEvent, AnyObservation
 from .schema.common import EvidenceSource
 
+if TYPE_CHECKING:
+    from .schema import AnyEvidence, AnyEvent, AnyObservation
+
 
 class EvidenceStore:
     """
@@ -140,16 +142,15 @@ class EvidenceStore:
         path.write_text(self.to_json())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "EvidenceStore":
+    def from_json(cls, json_str: str | bytes) -> "EvidenceStore":
         """Create store from JSON string."""
-        from . import load_evidence_from_json
-        data = json.loads(json_str)
-        return cls([load_evidence_from_json(item) for item in data])
+        from .loading import load_evidence_from_bytes
+        return cls(load_evidence_from_bytes(json_str))
 
     @classmethod
     def load(cls, path: str | Path) -> "EvidenceStore":
         """Load store from JSON file."""
-        return cls.from_json(Path(path).read_text())
+        return cls.from_json(Path(path).read_bytes())
 
     def merge(self, other: "EvidenceStore") -> None:
         """Merge another store into this one."""
@@ -13,12 +13,15 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src import helpers
 from src.helpers import (
     generate_evidence_id,
+    generate_evidence_ids,
     make_actor,
     make_repo,
     make_repo_from_full_name,
     parse_datetime_lenient,
+    parse_datetime_lenient_batch,
     parse_datetime_strict,
 )
 
@@ -37,6 +40,13 @@ class TestGenerateEvidenceId:
         id2 = generate_evidence_id("test", "a", "b", "c")
         assert id1 == id2
 
+    def test_stable_value(self):
+        """IDs stay stable across releases (stored evidence references them)."""
+        evidence_id = generate_evidence_id(
+            "push", "aws/aws-toolkit-vscode", "678851bbe9776228f55e0460e66a6167ac2a1685"
+        )
+        assert evidence_id == "push-c531496611b0"
+
     def test_different_inputs_different_ids(self):
         """Different inputs produce different IDs."""
         id1 = generate_evidence_id("test", "a", "b")
@@ -60,6 +70,13 @@ class TestGenerateEvidenceId:
         id2 = generate_evidence_id("commit", "repo", "sha")
         assert id1 != id2
 
+    def test_batch_matches_single(self):
+        """Batch generation matches per-row generation."""
+        rows = [("repo", "sha1"), ("repo", "sha2", "extra"), ()]
+        assert generate_evidence_ids("push", rows) == [
+            generate_evidence_id("push", *parts) for parts in rows
+        ]
+
     def test_empty_parts(self):
         """Handles empty parts list."""
         evidence_id = generate_evidence_id("test")
@@ -90,6 +107,21 @@ class TestParseDatetimeLenient:
         result = parse_datetime_lenient(dt)
         assert result == dt
 
+    def test_datetime_subclass_passthrough(self):
+        """datetime subclasses pass through unchanged."""
+
+        class Timestamp(datetime):
+            pass
+
+        dt = Timestamp(2025, 7, 13, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_datetime_lenient(dt) is dt
+
+    def test_unsupported_type_returns_now(self):
+        """Unsupported types return current time."""
+        result = parse_datetime_lenient(12345)
+        now = datetime.now(timezone.utc)
+        assert abs((now - result).total_seconds()) < 5
+
     def test_iso_format_with_z(self):
         """Parses ISO format with Z suffix."""
         result = parse_datetime_lenient("2025-07-13T20:37:04Z")
@@ -106,6 +138,31 @@ class TestParseDatetimeLenient:
         assert result.year == 2025
         assert result.hour == 7
 
+    def test_space_separated_with_zone_name(self):
+        """Parses BigQuery-style timestamps with a zone name suffix."""
+        result = parse_datetime_lenient("2025-07-13 20:37:04 UTC")
+        assert result == datetime(2025, 7, 13, 20, 37, 4, tzinfo=timezone.utc)
+
+    def test_unpadded_fields(self):
+        """Parses non-zero-padded timestamps that ISO parsers reject."""
+        expected = datetime(2025, 7, 3, 1, 2, 3, tzinfo=timezone.utc)
+        assert parse_datetime_lenient("2025-7-3T1:02:03Z") == expected
+        assert parse_datetime_lenient("2025-7-3T1:02:03z") == expected
+        assert parse_datetime_lenient("2025-7-3 1:02:03 UTC") == expected
+        assert parse_datetime_lenient("2025-7-3 1:02:03") == expected
+
+    def test_fallback_keeps_offset(self):
+        """Numeric offsets parsed by the strptime fallback are not overwritten with UTC."""
+        result = parse_datetime_lenient("2025-7-13T22:37:04+0200")
+        assert result.utcoffset().total_seconds() == 7200
+        assert result == datetime(2025, 7, 13, 20, 37, 4, tzinfo=timezone.utc)
+
+    def test_without_ciso8601(self, monkeypatch):
+        """Falls back to the stdlib parsers when ciso8601 is unavailable."""
+        monkeypatch.setattr(helpers, "ciso8601", None)
+        result = parse_datetime_lenient("2025-07-13T20:37:04Z")
+        assert result == datetime(2025, 7, 13, 20, 37, 4, tzinfo=timezone.utc)
+
     def test_invalid_string_returns_now(self):
         """Invalid string returns current time (graceful degradation)."""
         result = parse_datetime_lenient("not a date")
@@ -115,6 +172,24 @@ class TestParseDatetimeLenient:
         assert abs((now - result).total_seconds()) < 5
 
 
+class TestParseDatetimeLenientBatch:
+    """Test batch lenient datetime parsing."""
+
+    def test_mixed_values(self):
+        """Parses strings, passes datetimes through, and defaults the rest."""
+        default = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        dt = datetime(2025, 7, 13, 12, 0, 0, tzinfo=timezone.utc)
+        result = parse_datetime_lenient_batch(
+            ["2025-07-13T20:37:04Z", dt, None, "not a date"], default
+        )
+        assert result == [
+            datetime(2025, 7, 13, 20, 37, 4, tzinfo=timezone.utc),
+            dt,
+            default,
+            default,
+        ]
+
+
 # =============================================================================
 # DATETIME PARSING TESTS - STRICT
 # =============================================================================
@@ -141,6 +216,12 @@ class TestParseDatetimeStrict:
         assert result.year == 2025
         assert result.month == 7
 
+    def test_iso_format_with_offset(self):
+        """Keeps non-UTC offsets."""
+        result = parse_datetime_strict("2025-07-13T22:37:04+02:00")
+        assert result == datetime(2025, 7, 13, 20, 37, 4, tzinfo=timezone.utc)
+        assert result.utcoffset().total_seconds() == 7200
+
     def test_invalid_string_raises(self):
         """Invalid string raises ValueError."""
         with pytest.raises(ValueError, match="Unable to parse"):
@@ -189,6 +270,18 @@ class TestMakeRepo:
         assert repo.name == "aws-toolkit-vscode"
         assert repo.full_name == "aws/aws-toolkit-vscode"
 
+    def test_reuses_instances(self):
+        """Both factories return the same shared instance for a repository."""
+        repo = make_repo("aws", "aws-toolkit-vscode")
+        assert make_repo("aws", "aws-toolkit-vscode") is repo
+        assert make_repo_from_full_name("aws/aws-toolkit-vscode") is repo
+
+    def test_shared_repo_is_immutable(self):
+        """Shared instances cannot be mutated."""
+        repo = make_repo("aws", "aws-toolkit-vscode")
+        with pytest.raises(ValueError):
+            repo.name = "other"
+
 
 class TestMakeRepoFromFullName:
     """Test GitHubRepository creation from full name."""
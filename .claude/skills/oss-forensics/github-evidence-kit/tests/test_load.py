@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Unit tests for load_evidence_from_json.
+
+Tests discriminator dispatch and error handling when loading serialized evidence.
+Fixtures are defined in conftest.py.
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import get_args
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import (
+    AnyEvent,
+    EvidenceSource,
+    EvidenceStore,
+    AnyObservation,
+    build_validators,
+    load_evidence_from_bytes,
+    load_evidence_from_json,
+    load_evidence_stream,
+)
+from src.loading import (
+    _EVENT_TYPE_MAP,
+    _EVENT_VALIDATORS,
+    _OBSERVATION_TYPE_MAP,
+    _OBSERVATION_VALIDATORS,
+)
+from src.schema.events import PushEvent
+from src.schema.observations import IOC, CommitObservation
+
+
+# =============================================================================
+# DISPATCH TABLE TESTS
+# =============================================================================
+
+
+class TestTypeMaps:
+    """Test the discriminator lookup tables."""
+
+    def test_event_map_covers_union(self):
+        """Every event model is reachable by its event_type tag."""
+        expected = {cls.model_fields["event_type"].default: cls for cls in get_args(AnyEvent)}
+        assert _EVENT_TYPE_MAP == expected
+
+    def test_build_validators(self):
+        """Building validators completes every deferred model."""
+        build_validators()
+        for cls in (*_EVENT_TYPE_MAP.values(), *_OBSERVATION_TYPE_MAP.values()):
+            assert cls.__pydantic_complete__
+        assert _EVENT_VALIDATORS.keys() == _EVENT_TYPE_MAP.keys()
+        assert _OBSERVATION_VALIDATORS.keys() == _OBSERVATION_TYPE_MAP.keys()
+
+    def test_observation_map_covers_union(self):
+        """Every observation model is reachable by its observation_type tag."""
+        expected = {cls.model_fields["observation_type"].default: cls for cls in get_args(AnyObservation)}
+        assert _OBSERVATION_TYPE_MAP == expected
+
+
+# =============================================================================
+# LOADING TESTS
+# =============================================================================
+
+
+class TestLoadEvidenceFromJson:
+    """Test loading evidence dictionaries into models."""
+
+    def test_loads_event(self, sample_push_event_data):
+        """Event data loads into the matching event model."""
+        event = load_evidence_from_json(sample_push_event_data)
+        assert isinstance(event, PushEvent)
+        assert event.after_sha == sample_push_event_data["after_sha"]
+
+    def test_loads_observation(self, sample_commit_observation_data, sample_ioc_data):
+        """Observation data loads into the matching observation model."""
+        assert isinstance(load_evidence_from_json(sample_commit_observation_data), CommitObservation)
+        assert isinstance(load_evidence_from_json(sample_ioc_data), IOC)
+
+    def test_unknown_event_type_raises(self, sample_push_event_data):
+        """Unknown event_type raises ValueError."""
+        sample_push_event_data["event_type"] = "bogus"
+        with pytest.raises(ValueError, match="Unknown event_type"):
+            load_evidence_from_json(sample_push_event_data)
+
+    def test_unknown_observation_type_raises(self, sample_ioc_data):
+        """Unknown observation_type raises ValueError."""
+        sample_ioc_data["observation_type"] = "bogus"
+        with pytest.raises(ValueError, match="Unknown observation_type"):
+            load_evidence_from_json(sample_ioc_data)
+
+    def test_unhashable_type_raises(self, sample_push_event_data):
+        """Non-string discriminator values raise ValueError."""
+        sample_push_event_data["event_type"] = ["push"]
+        with pytest.raises(ValueError, match="Unknown event_type"):
+            load_evidence_from_json(sample_push_event_data)
+
+    def test_invalid_fields_raise(self, sample_push_event_data):
+        """Known type with invalid fields raises ValueError."""
+        del sample_push_event_data["after_sha"]
+        with pytest.raises(ValueError):
+            load_evidence_from_json(sample_push_event_data)
+
+    def test_loads_raw_json(self, sample_push_event_data, sample_ioc_data):
+        """Raw JSON text or bytes loads like the decoded dict."""
+        raw = json.dumps(sample_push_event_data)
+        assert load_evidence_from_json(raw) == load_evidence_from_json(sample_push_event_data)
+        assert isinstance(load_evidence_from_json(json.dumps(sample_ioc_data).encode()), IOC)
+
+    def test_raw_json_unknown_type_raises(self, sample_ioc_data):
+        """Raw JSON with an unknown type raises ValueError."""
+        sample_ioc_data["observation_type"] = "bogus"
+        with pytest.raises(ValueError):
+            load_evidence_from_json(json.dumps(sample_ioc_data))
+
+    def test_missing_discriminator_raises(self):
+        """Data without a type field raises ValueError."""
+        with pytest.raises(ValueError, match="must contain"):
+            load_evidence_from_json({"evidence_id": "x"})
+
+
+# =============================================================================
+# ROUND-TRIP TESTS
+# =============================================================================
+
+
+class TestRoundTrip:
+    """Test loading evidence that was dumped from validated models."""
+
+    def test_python_dump_round_trip(self, sample_commit_observation):
+        """A model_dump() loads back into an equal model."""
+        loaded = load_evidence_from_json(sample_commit_observation.model_dump())
+        assert isinstance(loaded, CommitObservation)
+        assert loaded == sample_commit_observation
+
+    def test_store_json_item_round_trip(self, sample_push_event, sample_commit_observation):
+        """Stored (JSON-mode) items load back with typed values."""
+        store = EvidenceStore([sample_push_event, sample_commit_observation])
+        event_data, commit_data = json.loads(store.to_json())
+
+        event = load_evidence_from_json(event_data)
+        assert isinstance(event.when, datetime)
+        assert event.verification.source is EvidenceSource.GHARCHIVE
+        assert event == sample_push_event
+
+        commit = load_evidence_from_json(commit_data)
+        assert isinstance(commit.author.date, datetime)
+        assert commit == sample_commit_observation
+        assert EvidenceStore([event, commit]).filter(after=datetime(2025, 1, 1, tzinfo=timezone.utc)) == [event, commit]
+
+
+# =============================================================================
+# BULK LOADING TESTS
+# =============================================================================
+
+
+class TestBulkLoading:
+    """Test loading raw JSON arrays and JSON Lines."""
+
+    def test_bytes_mixed_evidence(self, sample_push_event_data, sample_ioc_data):
+        """Events and observations load from one JSON array, in order."""
+        raw = json.dumps([sample_push_event_data, sample_ioc_data]).encode()
+        loaded = load_evidence_from_bytes(raw)
+        assert [type(e) for e in loaded] == [PushEvent, IOC]
+        assert loaded[0] == load_evidence_from_json(sample_push_event_data)
+
+    def test_bytes_unknown_type_raises(self, sample_ioc_data):
+        """Unknown types in the array raise ValueError."""
+        sample_ioc_data["observation_type"] = "bogus"
+        with pytest.raises(ValueError):
+            load_evidence_from_bytes(json.dumps([sample_ioc_data]))
+
+    def test_bytes_missing_discriminator_raises(self):
+        """Items without a type field raise ValueError."""
+        with pytest.raises(ValueError):
+            load_evidence_from_bytes(b'[{"evidence_id": "x"}]')
+
+    def test_stream_json_lines(self, sample_push_event_data, sample_commit_observation_data):
+        """JSON Lines load lazily, skipping blank lines."""
+        lines = [json.dumps(sample_push_event_data), "", json.dumps(sample_commit_observation_data)]
+        loaded = list(load_evidence_stream(lines))
+        assert [type(e) for e in loaded] == [PushEvent, CommitObservation]
+
+
+# =============================================================================
+# LAZY IMPORT TESTS
+# =============================================================================
+
+
+class TestLazyImports:
+    """Test that the package defers loading the event/observation models."""
+
+    def test_import_skips_models(self):
+        """Importing the package loads neither models nor the loader."""
+        code = (
+            "import sys; import src; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "src.schema.events" not in result.stdout
+        assert "src.schema.observations" not in result.stdout
+        assert "src.loading" not in result.stdout
+
+    def test_load_builds_only_loaded_model(self, sample_push_event):
+        """Loading one type builds that model's validator and leaves the rest deferred."""
+        code = (
+            "import json, sys; from src import load_evidence_from_json; "
+            "from src.schema.events import PushEvent; "
+            "from src.schema.observations import IOC; "
+            "load_evidence_from_json(json.loads(sys.stdin.read())); "
+            "print(PushEvent.__pydantic_complete__, IOC.__pydantic_complete__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            input=sample_push_event.model_dump_json(),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "True False"
+
+    def test_lazy_names_resolve(self):
+        """Lazy names resolve on access and unadvertised names still raise."""
+        import src
+        import src.schema
+
+        assert src.load_evidence_from_json is load_evidence_from_json
+        assert src.schema.PushEvent is PushEvent
+        with pytest.raises(AttributeError):
+            src.NotARealName
+        with pytest.raises(AttributeError):
+            src.GitHubActor
+
+    def test_dir_lists_lazy_names(self):
+        """dir() includes names that have not been resolved yet."""
+        import src
+        import src.schema
+
+        assert set(src.__all__) <= set(dir(src))
+        assert set(src.schema.__all__) <= set(dir(src.schema))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])